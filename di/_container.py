@@ -6,6 +6,7 @@ from contextlib import AsyncExitStack, ExitStack, contextmanager
 from types import TracebackType
 from typing import (
     Any,
+    Callable,
     ContextManager,
     Generator,
     Generic,
@@ -151,35 +152,37 @@ class ScopeContext(FusedContextManager[ScopeState]):
 
 
 class TaskGraph:
-    __slots__ = ("_uncopied_ts", "_copied_ts", "_static_order")
+    __slots__ = ("_get_ts", "_get_static_order", "_copied_ts")
     _copied_ts: TopologicalSorter[Task] | None
 
     def __init__(
         self,
-        ts: TopologicalSorter[Task],
-        static_order: Iterable[Task],
+        get_ts: Callable[[], TopologicalSorter[Task]],
+        get_static_order: Callable[[], Iterable[Task]],
     ) -> None:
-        self._uncopied_ts = ts
+        # the sorter and static order are built on first use
+        # so executors only pay for the one they actually use
+        self._get_ts = get_ts
+        self._get_static_order = get_static_order
         self._copied_ts = None
-        self._static_order = static_order
 
     def get_ready(self) -> Iterable[Task]:
         if self._copied_ts is None:
-            self._copied_ts = self._uncopied_ts.copy()
+            self._copied_ts = self._get_ts().copy()
         return self._copied_ts.get_ready()
 
     def done(self, task: SupportsTask) -> None:
         if self._copied_ts is None:
-            self._copied_ts = self._uncopied_ts.copy()
+            self._copied_ts = self._get_ts().copy()
         self._copied_ts.done(cast(Task, task))
 
     def is_active(self) -> bool:
         if self._copied_ts is None:
-            self._copied_ts = self._uncopied_ts.copy()
+            self._copied_ts = self._get_ts().copy()
         return self._copied_ts.is_active()
 
     def static_order(self) -> Iterable[Task]:
-        return self._static_order
+        return self._get_static_order()
 
 
 EMPTY_VALUES: dict[DependencyProvider, Any] = {}
@@ -193,6 +196,8 @@ POSITIONAL_PARAMS = (
     inspect.Parameter.POSITIONAL_OR_KEYWORD,
 )
 
+EMPTY_DEFAULT = inspect.Parameter.empty
+
 
 class ScopeResolver(Protocol):
     def __call__(
@@ -220,34 +225,49 @@ def get_path_str(path: Iterable[DependentBase[Any]]) -> str:
     )
 
 
+def apply_binds(
+    binds: Iterable[BindHook],
+    param: inspect.Parameter | None,
+    dependent: DependentBase[Any],
+) -> DependentBase[Any]:
+    """Run a dependent through all bind hooks, each hook sees the previous hook's result"""
+    for hook in binds:
+        match = hook(param, dependent)
+        if match is not None:
+            dependent = match
+    return dependent
+
+
 def get_params(
     dep: DependentBase[Any],
-    binds: Iterable[BindHook],
+    binds: Sequence[BindHook],
     path: Iterable[DependentBase[Any]],
 ) -> list[DependencyParameter]:
     """Get Dependents for parameters and resolve binds"""
-    params = dep.get_dependencies().copy()
-    for idx, param in enumerate(params):
-        for hook in binds:
-            match = hook(param.parameter, param.dependency)
-            if match is not None:
-                param = param._replace(dependency=match)
-        params[idx] = param
-        if param.parameter is not None:
-            if (
-                param.dependency.call is None
-                and param.parameter.default is param.parameter.empty
-            ):
-                raise WiringError(
-                    (
-                        f"The parameter {param.parameter.name} to {dep.call} has no dependency marker,"
-                        " no type annotation and no default value."
-                        " This will produce a TypeError when this function is called."
-                        " You must either provide a dependency marker, a type annotation or a default value."
-                        f"\nPath: {get_path_str([*path, dep])}"
-                    ),
-                    path=[*path, dep],
-                )
+    params: list[DependencyParameter] = []
+    for param in dep.get_dependencies():
+        dependency, parameter = param
+        if binds:
+            bound = apply_binds(binds, parameter, dependency)
+            if bound is not dependency:
+                param = param._replace(dependency=bound)
+                dependency = bound
+        params.append(param)
+        if (
+            dependency.call is None
+            and parameter is not None
+            and parameter.default is EMPTY_DEFAULT
+        ):
+            raise WiringError(
+                (
+                    f"The parameter {parameter.name} to {dep.call} has no dependency marker,"
+                    " no type annotation and no default value."
+                    " This will produce a TypeError when this function is called."
+                    " You must either provide a dependency marker, a type annotation or a default value."
+                    f"\nPath: {get_path_str([*path, dep])}"
+                ),
+                path=[*path, dep],
+            )
     return params
 
 
@@ -262,8 +282,9 @@ def check_task_scope_validity(
             f"Dependency{task.unwrapped_call} has an unknown scope {task.scope}."
             f"\nExample Path: {get_path_str(path)}"
         )
+    task_scope_idx = scopes[task.scope]
     for subtask in subtasks:
-        if scopes[task.scope] < scopes[subtask.scope]:
+        if task_scope_idx < scopes[subtask.scope]:
             raise ScopeViolationError(
                 f"{task.unwrapped_call} cannot depend on {subtask.unwrapped_call}"
                 f" because {subtask.unwrapped_call}'s scope ({subtask.scope})"
@@ -274,78 +295,88 @@ def check_task_scope_validity(
 
 def build_task(  # noqa: C901
     dependency: DependentBase[Any],
-    binds: Iterable[BindHook],
+    binds: Sequence[BindHook],
     tasks: dict[CacheKey, Task],
     task_dag: dict[Task, list[Task]],
     dependent_dag: dict[DependentBase[Any], list[DependencyParameter]],
-    path: dict[DependentBase[Any], Any],
+    path: dict[DependencyProvider, DependentBase[Any]],
     scope_idxs: Mapping[Scope, int],
+    solver_scopes: Sequence[Scope],
     scope_resolver: ScopeResolver | None,
 ) -> Task:
     call = dependency.call
     assert call is not None
     scope = dependency.scope
+    # cache_key may be an arbitrarily expensive property (e.g. JoinedDependent)
+    # so we compute it once per call
+    cache_key = dependency.cache_key
 
-    if dependency.call in {d.call for d in path}:
+    if call in path:
         raise DependencyCycleError(
             "Dependencies are in a cycle",
-            list(path.keys()),
+            list(path.values()),
         )
 
-    params = get_params(dependency, binds, path)
+    if cache_key in tasks:
+        # this dependency was already solved via another path
+        # so there is no need to walk its sub-dependencies again
+        task = tasks[cache_key]
+        if scope_resolver:
+            child_scopes = [st.scope for st in task_dag[task]]
+            scope = scope_resolver(dependency, child_scopes, solver_scopes)
+        if task.scope != scope:
+            raise SolvingError(
+                f"{dependency.call} was used with multiple scopes",
+                path=[*path.values(), dependency],
+            )
+        return task
+
+    params = get_params(dependency, binds, path.values())
 
     positional_parameters: list[Task] = []
     keyword_parameters: dict[str, Task] = {}
     subtasks: list[Task] = []
-    dep_params: list[DependencyParameter] = []
 
-    path[dependency] = None  # any value will do, we only use the keys
+    path[call] = dependency
 
-    for param in params:
-        dep_params.append(param)
-        if param.dependency.call is not None:
+    for sub_dependency, parameter in params:
+        if sub_dependency.call is not None:
             child_task = build_task(
-                param.dependency,
+                sub_dependency,
                 binds,
                 tasks,
                 task_dag,
                 dependent_dag,
                 path,
                 scope_idxs,
+                solver_scopes,
                 scope_resolver,
             )
             subtasks.append(child_task)
-            if param.parameter is not None:
-                if param.parameter.kind in POSITIONAL_PARAMS:
+            if parameter is not None:
+                if parameter.kind in POSITIONAL_PARAMS:
                     positional_parameters.append(child_task)
                 else:
-                    keyword_parameters[param.parameter.name] = child_task
-        if (
-            param.dependency not in dependent_dag
-            and param.dependency.cache_key not in tasks
+                    keyword_parameters[parameter.name] = child_task
+        elif (
+            sub_dependency not in dependent_dag
+            and sub_dependency.cache_key not in tasks
         ):
-            dependent_dag[param.dependency] = []
+            # callable sub-dependencies always have their cache_key in tasks
+            # once build_task returns, so only non-callable ones can be added
+            # as leaves here
+            dependent_dag[sub_dependency] = []
     if scope_resolver:
         child_scopes = [st.scope for st in subtasks]
-        scope = scope_resolver(dependency, child_scopes, tuple(scope_idxs.keys()))
-
-    if dependency.cache_key in tasks:
-        if tasks[dependency.cache_key].scope != scope:
-            raise SolvingError(
-                f"{dependency.call} was used with multiple scopes",
-                path=list(path.keys()),
-            )
-        path.pop(dependency)
-        return tasks[dependency.cache_key]
+        scope = scope_resolver(dependency, child_scopes, solver_scopes)
 
-    task: Task
     if is_async_gen_callable(call):
         if dependency.use_cache:
             task = CachedAsyncContextManagerTask(
                 scope=scope,
                 dependent=dependency,
                 call=call,  # type: ignore[arg-type]
-                cache_key=dependency.cache_key,
+                cache_key=cache_key,
                 task_id=len(tasks),
                 positional_parameters=positional_parameters,
                 keyword_parameters=keyword_parameters,
@@ -365,7 +396,7 @@ def build_task(  # noqa: C901
                 scope=scope,
                 call=call,  # type: ignore[arg-type]
                 dependent=dependency,
-                cache_key=dependency.cache_key,
+                cache_key=cache_key,
                 task_id=len(tasks),
                 positional_parameters=positional_parameters,
                 keyword_parameters=keyword_parameters,
@@ -385,7 +416,7 @@ def build_task(  # noqa: C901
                 scope=scope,
                 call=call,  # type: ignore[arg-type]
                 dependent=dependency,
-                cache_key=dependency.cache_key,
+                cache_key=cache_key,
                 task_id=len(tasks),
                 positional_parameters=positional_parameters,
                 keyword_parameters=keyword_parameters,
@@ -405,7 +436,7 @@ def build_task(  # noqa: C901
                 scope=scope,
                 call=call,
                 dependent=dependency,
-                cache_key=dependency.cache_key,
+                cache_key=cache_key,
                 task_id=len(tasks),
                 positional_parameters=positional_parameters,
                 keyword_parameters=keyword_parameters,
@@ -420,17 +451,17 @@ def build_task(  # noqa: C901
                 keyword_parameters=keyword_parameters,
             )
 
-    dependent_dag[dependency] = dep_params
-    tasks[dependency.cache_key] = task
+    dependent_dag[dependency] = params
+    tasks[cache_key] = task
     task_dag[task] = subtasks
     check_task_scope_validity(
         task,
         subtasks,
         scope_idxs,
-        path,
+        path.values(),
     )
     # remove ourselves from the path
-    path.pop(dependency)
+    path.pop(call)
     return task
 
 
@@ -444,11 +475,10 @@ def solve(
 
     Returns a SolvedDependent that can be executed to get the dependency's value.
     """
+    # freeze the binds so that we can cheaply skip them if there are none
+    binds = tuple(binds)
     # If the dependency itself is a bind, replace it
-    for hook in binds:
-        match = hook(None, dependency)
-        if match:
-            dependency = match
+    dependency = apply_binds(binds, None, dependency)
 
     if dependency.call is None:  # pragma: no cover
         raise ValueError("DependentBase.call must not be None")
@@ -468,23 +498,21 @@ def solve(
         task_dag=task_dag,
         dependent_dag=dep_dag,
         # we use a dict to represent the path so that we can have
-        # both O(1) lookups, and an ordered mutable sequence (via dict keys)
-        # we simply ignore / don't use the dict values
+        # both O(1) cycle detection (via the keys, which are the calls;
+        # a call appearing twice is a cycle so keys never collide)
+        # and an ordered mutable sequence of dependents (via the values)
         path={},
         scope_idxs=scope_idxs,
+        solver_scopes=tuple(scope_idxs.keys()),
         scope_resolver=scope_resolver,
     )
 
-    ts = TopologicalSorter(task_dag)
-    static_order = tuple(ts.copy().static_order())
-    ts.prepare()
     assert dependency.call is not None
     solved = SolvedDependent(
         dependency=dependency,
         dag=dep_dag,
         root_task=root_task,
-        topological_sorter=ts,
-        static_order=static_order,
+        task_dag=task_dag,
         empty_results=[None] * len(task_dag),
     )
     return solved
@@ -512,16 +540,31 @@ class SolvedDependent(Generic[DependencyType]):
         dependency: DependentBase[DependencyType],
         dag: Mapping[DependentBase[Any], Iterable[DependencyParameter]],
         root_task: Task,
-        topological_sorter: TopologicalSorter[Task],
-        static_order: Iterable[Task],
+        task_dag: Mapping[Task, Iterable[Task]],
         empty_results: list[Any],
     ):
         self.dependency = dependency
         self.dag = dag
         self._root_task = root_task
-        self._topological_sorter = topological_sorter
-        self._static_order = static_order
+        self._task_dag = task_dag
         self._empty_results = empty_results
+        self._static_order: tuple[Task, ...] | None = None
+        self._topological_sorter: TopologicalSorter[Task] | None = None
+
+    def _get_static_order(self) -> tuple[Task, ...]:
+        if self._static_order is None:
+            # tasks are added to task_dag only after all of their subtasks
+            # so its insertion order is already a valid topological order
+            self._static_order = tuple(self._task_dag)
+        return self._static_order
+
+    def _get_topological_sorter(self) -> TopologicalSorter[Task]:
+        # only executors that use get_ready() / done() need this
+        if self._topological_sorter is None:
+            ts = TopologicalSorter(self._task_dag)
+            ts.prepare()
+            self._topological_sorter = ts
+        return self._topological_sorter
 
     def _prepare_execution(
         self,
@@ -538,10 +581,7 @@ class SolvedDependent(Generic[DependencyType]):
             results=results,
             cache=cache,
         )
-        ts = TaskGraph(
-            self._topological_sorter,
-            self._static_order,
-        )
+        ts = TaskGraph(self._get_topological_sorter, self._get_static_order)
         return (
             results,
             ts,
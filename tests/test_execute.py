@@ -336,3 +336,43 @@ def test_unknown_scope() -> None:
     container = Container()
     with pytest.raises(UnknownScopeError):
         container.solve(Dependent(bad_dep, scope="app"), scopes=["app"])
+
+
+def test_sequential_execution_order() -> None:
+    """Sequential executors run dependencies depth first, in parameter order.
+    Generator dependencies are torn down in the reverse order.
+    """
+
+    events: List[str] = []
+
+    def x() -> Generator[None, None, None]:
+        events.append("enter x")
+        yield
+        events.append("exit x")
+
+    def a(v: Annotated[None, Marker(x)]) -> Generator[None, None, None]:
+        events.append("enter a")
+        yield
+        events.append("exit a")
+
+    def b() -> Generator[None, None, None]:
+        events.append("enter b")
+        yield
+        events.append("exit b")
+
+    def root(p: Annotated[None, Marker(a)], q: Annotated[None, Marker(b)]) -> None:
+        events.append("root")
+
+    container = Container()
+    solved = container.solve(Dependent(root), scopes=[None])
+    with container.enter_scope(None) as state:
+        solved.execute_sync(executor=SyncExecutor(), state=state)
+    assert events == [
+        "enter x",
+        "enter a",
+        "enter b",
+        "root",
+        "exit b",
+        "exit a",
+        "exit x",
+    ]
@@ -185,6 +185,72 @@ def test_non_parameter_dependency():
     assert calls == 1
 
 
+def test_shared_dependency_is_wired_once() -> None:
+    """A dependency reached via multiple paths only has its sub-dependencies collected once"""
+
+    wired: List[DependencyProvider] = []
+
+    class CountingDependent(Dependent[Any]):
+        def get_dependencies(self) -> List[DependencyParameter]:
+            assert self.call is not None
+            wired.append(self.call)
+            return [
+                p._replace(dependency=CountingDependent(p.dependency.call))
+                for p in super().get_dependencies()
+            ]
+
+    def leaf() -> int:
+        return 1
+
+    def shared(v: Annotated[int, Marker(leaf)]) -> int:
+        return v
+
+    def left(v: Annotated[int, Marker(shared)]) -> int:
+        return v
+
+    def right(v: Annotated[int, Marker(shared)]) -> int:
+        return v
+
+    def root(a: Annotated[int, Marker(left)], b: Annotated[int, Marker(right)]) -> int:
+        return a + b
+
+    container = Container()
+    solved = container.solve(CountingDependent(root), scopes=[None])
+    assert sorted(wired, key=lambda c: c.__name__) == [leaf, left, right, root, shared]
+    with container.enter_scope(None) as state:
+        assert solved.execute_sync(executor=SyncExecutor(), state=state) == 2
+
+
+def test_shared_dependency_not_cached_children_are_not_duplicated() -> None:
+    """Non-cached sub-dependencies of a shared dependency are only solved (and executed) once"""
+
+    calls = 0
+
+    def uncached() -> int:
+        nonlocal calls
+        calls += 1
+        return 1
+
+    def shared(v: Annotated[int, Marker(uncached, use_cache=False)]) -> int:
+        return v
+
+    def left(v: Annotated[int, Marker(shared)]) -> int:
+        return v
+
+    def right(v: Annotated[int, Marker(shared)]) -> int:
+        return v
+
+    def root(a: Annotated[int, Marker(left)], b: Annotated[int, Marker(right)]) -> int:
+        return a + b
+
+    container = Container()
+    solved = container.solve(Dependent(root), scopes=[None])
+    assert len(solved.dag) == 5
+    with container.enter_scope(None) as state:
+        assert solved.execute_sync(executor=SyncExecutor(), state=state) == 2
+    assert calls == 1
+
+
 class CannotBeWired:
     def __init__(self, arg) -> None:  # type: ignore # for Pylance
         assert arg == 1  # a sentinel value to make sure a bug didn't inject something